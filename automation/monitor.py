@@ -14,25 +14,44 @@ to reduce the CO2 concentration. After 5 minutes, the fan is automatically turne
 
 import time
 import os
+import sys
+import logging
 import sqlite3
 from RPi import GPIO
 from dotenv import load_dotenv
 
+# Add parent directory to the path to import the snapshot reader
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from snapshot import SnapshotReader, DEFAULT_SNAPSHOT_PATH  # pylint: disable=wrong-import-position
+from sensor_logging import setup_logging  # pylint: disable=wrong-import-position
+
 load_dotenv()
 
 # Configuration
 DB_PATH = os.getenv('DB_PATH')
+SNAPSHOT_PATH = os.getenv('SNAPSHOT_PATH', DEFAULT_SNAPSHOT_PATH)
 RELAY_PIN = 17  # GPIO pin connected to the relay (use the BCM numbering)
 CO2_THRESHOLD_ON = 800  # CO2 ppm level to turn relay on
 FAN_DURATION = 300  # Duration to keep the fan on (in seconds)
 
+logger = logging.getLogger('monitor')
+
 # Set up GPIO
 GPIO.setmode(GPIO.BCM)
 GPIO.setup(RELAY_PIN, GPIO.OUT)
 GPIO.output(RELAY_PIN, GPIO.LOW)
 
+snapshot_reader = SnapshotReader(SNAPSHOT_PATH)
+
 def get_last_co2_value(db_path):
-    """Retrieve the most recent CO2 value from the database."""
+    """
+    Retrieve the most recent CO2 value from the shared snapshot,
+    falling back to the database if the snapshot is missing or stale.
+    """
+    reading = snapshot_reader.read()
+    if reading:
+        return reading['co2']
+
     try:
         conn = sqlite3.connect(db_path)
         cursor = conn.cursor()
@@ -45,21 +64,21 @@ def get_last_co2_value(db_path):
         if result:
             return result[0]
 
-        print("No data found in the database.")
+        logger.warning("No data found in the database.")
         return None
     except sqlite3.Error as e:
-        print(f"Database error: {e}")
+        logger.error("Database error: %s", e)
         return None
 
 def activate_fan():
     """Activate the fan by turning the relay on."""
     GPIO.output(RELAY_PIN, GPIO.HIGH)
-    print("Relay turned ON - Fan activated.")
+    logger.info("Relay turned ON - Fan activated.")
 
 def deactivate_fan():
     """Deactivate the fan by turning the relay off."""
     GPIO.output(RELAY_PIN, GPIO.LOW)
-    print("Relay turned OFF - Fan deactivated.")
+    logger.info("Relay turned OFF - Fan deactivated.")
 
 def main():
     """Main loop to monitor CO2 levels and control the fan."""
@@ -71,7 +90,7 @@ def main():
             co2_value = get_last_co2_value(DB_PATH)
 
             if co2_value is not None:
-                print(f"CO2 concentration: {co2_value} ppm")
+                logger.info("CO2 concentration: %d ppm", co2_value)
 
                 current_time = time.time()
 
@@ -83,27 +102,29 @@ def main():
                 else:
                     if current_time - fan_start_time >= FAN_DURATION:
                         deactivate_fan()
-                        print("Pausing fan for 5 minutes.")
+                        logger.info("Pausing fan for 5 minutes.")
                         time.sleep(300)
-                        print("Resuming monitoring after pause.")
+                        logger.info("Resuming monitoring after pause.")
                         fan_active = False
                         fan_start_time = None
                     else:
                         remaining_time = int(FAN_DURATION - (current_time - fan_start_time))
-                        print(
-                            f"Fan is active. Time remaining: {remaining_time} seconds."
+                        logger.info(
+                            "Fan is active. Time remaining: %d seconds.", remaining_time
                         )
 
             time.sleep(5)
 
     except KeyboardInterrupt:
-        print("Script interrupted by user")
+        logger.info("Script interrupted by user")
 
     finally:
         if fan_active:
             deactivate_fan()
         GPIO.cleanup()
-        print("GPIO cleanup done")
+        snapshot_reader.close()
+        logger.info("GPIO cleanup done")
 
 if __name__ == '__main__':
+    setup_logging()
     main()
@@ -0,0 +1,74 @@
+"""
+Benchmark collector ingest throughput with many nodes posting at once.
+
+Each node is a separate process that sends gzip-compressed batches to a
+running collector, the same way forwarder.py does. Start the collector
+first, for example:
+
+    COLLECTOR_DB_PATH=/tmp/bench_collector.db python collector/collector_server.py
+
+Usage:
+    python benchmarks/bench_collector.py [url] [nodes] [batches] [batch_size]
+"""
+
+import sys
+import gzip
+import json
+import time
+import uuid
+import urllib.request
+from multiprocessing import Pool
+
+DEFAULT_URL = 'http://127.0.0.1:5050/ingest'
+
+
+def run_node(args):
+    """Send a number of batches as one node and return how many readings were accepted."""
+    url, node_id, batches, batch_size = args
+    bodies = [
+        gzip.compress(json.dumps({
+            'node_id': node_id,
+            'readings': [{
+                'id': uuid.uuid4().hex,
+                'date': "2025-03-16 12:00:00",
+                'co2': 600 + i,
+                'temperature': 22.5,
+                'humidity': 45.0,
+            } for i in range(batch_size)],
+        }).encode('utf-8'))
+        for _ in range(batches)
+    ]
+
+    inserted = 0
+    for body in bodies:
+        req = urllib.request.Request(
+            url,
+            data=body,
+            headers={'Content-Type': 'application/json', 'Content-Encoding': 'gzip'},
+            method='POST',
+        )
+        with urllib.request.urlopen(req, timeout=30) as response:
+            inserted += json.loads(response.read())['inserted']
+    return inserted
+
+
+def main():
+    """Run all nodes in parallel and print the collector throughput."""
+    url = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_URL
+    nodes = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    batches = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+    batch_size = int(sys.argv[4]) if len(sys.argv) > 4 else 30
+
+    jobs = [(url, f"bench-{n}", batches, batch_size) for n in range(nodes)]
+    with Pool(nodes) as pool:
+        start = time.perf_counter()
+        inserted = sum(pool.map(run_node, jobs))
+        elapsed = time.perf_counter() - start
+
+    print(f"nodes: {nodes}, batches per node: {batches}, readings per batch: {batch_size}")
+    print(f"inserted {inserted} readings in {elapsed:.2f} s")
+    print(f"{inserted / elapsed:.0f} readings/s, {nodes * batches / elapsed:.0f} requests/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark ingest throughput of CO2Sensor.parse_data with per-frame print()
+output versus the rate-limited queue logger from sensor_logging.
+
+Both modes write line-buffered to a pipe drained by a child process, the
+way systemd hands a service's output to journald. Database writes are
+discarded so the measurement covers only frame parsing and log output.
+
+Usage:
+    python benchmarks/bench_ingest_logging.py [frames]
+"""
+
+import os
+import sys
+import io
+import time
+import logging
+import contextlib
+import subprocess
+from unittest.mock import patch
+
+# Add parent directory to the path to import CO2Sensor
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import co2_sensor  # pylint: disable=wrong-import-position
+from sensor_logging import setup_logging, shutdown_logging  # pylint: disable=wrong-import-position
+
+FRAMES = [
+    [0x50, 0x02, 0x58, 0x00, 0x0D, 0x00, 0x00, 0x00],  # CO2 600 ppm
+    [0x42, 0x12, 0x9A, 0x00, 0x0D, 0x00, 0x00, 0x00],  # Temperature ~24.5 °C
+    [0x41, 0x13, 0x88, 0x00, 0x0D, 0x00, 0x00, 0x00],  # Humidity 50%
+]
+
+
+class PrintLogger:  # pylint: disable=too-few-public-methods
+    """Logger stand-in that prints every message, like the sensor did before."""
+
+    def _print(self, msg, *args, extra=None):
+        line = msg % args if args else msg
+        if extra:
+            line += ' ' + ' '.join(f"{k}={v}" for k, v in extra['fields'].items())
+        print(line)
+
+    debug = info = warning = error = _print
+
+
+class NullConnection:
+    """Connection stand-in that discards writes, so only parsing and logging are measured."""
+
+    def cursor(self):
+        """Return this object as its own cursor."""
+        return self
+
+    def execute(self, *args):
+        """Discard the statement."""
+
+    def commit(self):
+        """Nothing to commit."""
+
+    def close(self):
+        """Nothing to close."""
+
+
+# Child process that reads log lines like journald and reports how many it got
+DRAIN = "import sys\nprint(sum(1 for _ in sys.stdin.buffer))"
+
+
+def open_drain():
+    """Start the draining child process and return it with a line-buffered writer."""
+    proc = subprocess.Popen(  # pylint: disable=consider-using-with
+        [sys.executable, '-c', DRAIN],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+    )
+    sink = io.TextIOWrapper(proc.stdin, encoding='utf-8', line_buffering=True)
+    return proc, sink
+
+
+def close_drain(proc, sink):
+    """Close the pipe and return the number of lines the child process read."""
+    sink.close()
+    with proc.stdout:
+        lines = int(proc.stdout.read())
+    proc.wait()
+    return lines
+
+
+def run_ingest(frames, sink):
+    """Feed frames through parse_data, simulating the run loop's per-frame log line."""
+    sensor = co2_sensor.CO2Sensor(b'', ':memory:')
+    with patch('co2_sensor.sqlite3.connect', return_value=NullConnection()):
+        start = time.perf_counter()
+        for i in range(frames):
+            data = FRAMES[i % len(FRAMES)]
+            co2_sensor.logger.debug("Data read: %s", data)
+            sensor.parse_data(data)
+        sink.flush()
+        return frames / (time.perf_counter() - start)
+
+
+def main():
+    """Run both modes and print the throughput of each."""
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 30000
+
+    proc, sink = open_drain()
+    with patch('co2_sensor.logger', PrintLogger()), contextlib.redirect_stdout(sink):
+        print_rate = run_ingest(frames, sink)
+    print_lines = close_drain(proc, sink)
+
+    proc, sink = open_drain()
+    setup_logging(level=logging.INFO, rate_limit_interval=60, stream=sink)
+    logger_rate = run_ingest(frames, sink)
+    shutdown_logging()
+    logger_lines = close_drain(proc, sink)
+
+    print(f"{'mode':<8} {'frames/s':>12} {'log lines':>10}")
+    print(f"{'print':<8} {print_rate:>12.0f} {print_lines:>10}")
+    print(f"{'logger':<8} {logger_rate:>12.0f} {logger_lines:>10}")
+    print(f"speedup: {logger_rate / print_rate:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
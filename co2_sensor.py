@@ -1,16 +1,28 @@
 # pylint: disable=C0114
 # pylint: disable=import-error
 
+import os
 import time
+import logging
 import sqlite3
 from datetime import datetime
 import hid
+from forwarder import ReadingForwarder
+from snapshot import SnapshotWriter, DEFAULT_SNAPSHOT_PATH
+from sensor_logging import setup_logging
+
+logger = logging.getLogger('co2_sensor')
 
 DEVICE_PATH = b'/dev/hidraw0'
 
 DB_PATH = '../sensor_data.db'
 
-class CO2Sensor:
+COLLECTOR_URL = os.getenv('COLLECTOR_URL')
+NODE_ID = os.getenv('NODE_ID', os.uname().nodename)
+SPOOL_PATH = os.getenv('SPOOL_PATH', '../collector_spool.jsonl')
+SNAPSHOT_PATH = os.getenv('SNAPSHOT_PATH', DEFAULT_SNAPSHOT_PATH)
+
+class CO2Sensor:  # pylint: disable=too-many-instance-attributes
     """
     CO2Sensor handles communication with the USB-zyTemp CO2 sensor,
     parses incoming data, and stores sensor readings in a SQLite database.
@@ -22,15 +34,19 @@ class CO2Sensor:
         current_temperature (float or None): The latest temperature reading in °C.
         current_humidity (float or None): The latest humidity percentage.
         h (hid.device or None): The HID device instance for communication.
+        forwarder (ReadingForwarder or None): Forwards saved readings to a central collector.
+        snapshot (SnapshotWriter or None): Publishes the latest reading to other processes.
     """
 
-    def __init__(self, device_path, db_path):
+    def __init__(self, device_path, db_path, forwarder=None, snapshot=None):
         self.device_path = device_path
         self.db_path = db_path
         self.current_co2 = None
         self.current_temperature = None
         self.current_humidity = None
         self.h = None
+        self.forwarder = forwarder
+        self.snapshot = snapshot
 
     def save_to_db(self):
         """
@@ -58,14 +74,24 @@ class CO2Sensor:
             conn.commit()
             conn.close()
 
-            print(
-                f"Data saved to database: {current_time}; "
-                f"CO2: {self.current_co2} ppm; "
-                f"Temperature: {self.current_temperature:.2f} °C; "
-                f"Humidity: {self.current_humidity:.2f}%"
-            )
+            if self.snapshot:
+                self.snapshot.publish(
+                    self.current_co2, self.current_temperature, self.current_humidity
+                )
+            if self.forwarder:
+                self.forwarder.add(
+                    current_time, self.current_co2,
+                    self.current_temperature, self.current_humidity
+                )
+
+            logger.info("Data saved to database", extra={'fields': {
+                'date': current_time,
+                'co2': self.current_co2,
+                'temperature': self.current_temperature,
+                'humidity': self.current_humidity,
+            }})
         except sqlite3.Error as e:
-            print(f"Database error: {e}")
+            logger.error("Database error: %s", e)
 
     def parse_data(self, sensor_data):
         """
@@ -86,21 +112,21 @@ class CO2Sensor:
         value = (value_high << 8) + value_low
 
         if r4 != 0x0D:  # Ensure that the terminator byte is correct
-            print("Invalid data received.")
+            logger.warning("Invalid data received.")
             return
 
         if metric == 0x50:  # CO2 reading (0x50 = 80 in decimal)
             self.current_co2 = value
-            print(f"CO2 Level: {self.current_co2} ppm")
+            logger.debug("CO2 Level: %d ppm", self.current_co2)
         elif metric == 0x42:  # Temperature reading (0x42 = 66 in decimal)
             self.current_temperature = (value / 16.0) - 273.15
-            print(f"Temperature: {self.current_temperature:.2f} °C")
+            logger.debug("Temperature: %.2f °C", self.current_temperature)
         elif metric == 0x41:  # Humidity reading (0x41 = 65 in decimal)
             self.current_humidity = value / 100.0
             # Assuming humidity is reported in hundredths of a percent
-            print(f"Humidity: {self.current_humidity:.2f}%")
+            logger.debug("Humidity: %.2f%%", self.current_humidity)
         else:
-            print(f"Unknown metric: {metric}, value: {value}")
+            logger.debug("Unknown metric: %s, value: %s", metric, value)
 
         # If all three values (CO2, Temperature, Humidity)
         # have been updated, save them to the database
@@ -116,7 +142,7 @@ class CO2Sensor:
         Initialize the device and start reading data.
         """
         try:
-            print("Opening the device...")
+            logger.info("Opening the device...")
             self.h = hid.device()
             self.h.open_path(self.device_path)
 
@@ -130,22 +156,28 @@ class CO2Sensor:
             while True:
                 data = self.h.read(8, timeout_ms=10000)
                 if data:
-                    print(f"Data read: {data}")
+                    logger.debug("Data read: %s", data)
                     self.parse_data(data)
                 else:
-                    print("No data received from the device.")
+                    logger.warning("No data received from the device.")
                 time.sleep(10)
 
             self.h.close()
         except IOError as ex:
-            print(f"Error: {ex}")
-            print("Failed to open or communicate with the device.")
+            logger.error("Failed to open or communicate with the device: %s", ex)
         finally:
             if self.h:
                 self.h.close()
-            print("Done")
+            if self.forwarder:
+                self.forwarder.stop()
+            logger.info("Done")
 
 
 if __name__ == "__main__":
-    sensor = CO2Sensor(DEVICE_PATH, DB_PATH)
+    setup_logging()
+    reading_forwarder = None
+    if COLLECTOR_URL:
+        reading_forwarder = ReadingForwarder(COLLECTOR_URL, NODE_ID, SPOOL_PATH)
+        reading_forwarder.start()
+    sensor = CO2Sensor(DEVICE_PATH, DB_PATH, reading_forwarder, SnapshotWriter(SNAPSHOT_PATH))
     sensor.run()
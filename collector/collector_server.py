@@ -0,0 +1,175 @@
+# pylint: disable=C0114
+# pylint: disable=import-error
+
+import os
+import sys
+import json
+import zlib
+import logging
+import sqlite3
+from flask import Flask, request, jsonify
+from dotenv import load_dotenv
+
+# Add parent directory to the path to import the shared logging setup
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sensor_logging import setup_logging  # pylint: disable=wrong-import-position
+
+load_dotenv()
+
+app = Flask(__name__)
+logger = logging.getLogger('collector')
+
+# Largest request body accepted, and largest size a gzip body may expand to
+app.config['MAX_CONTENT_LENGTH'] = 2 * 1024 * 1024
+MAX_DECOMPRESSED_SIZE = 16 * 1024 * 1024
+
+COLLECTOR_DB_PATH = os.getenv('COLLECTOR_DB_PATH', 'collector_data.db')
+
+# Accepted types of each reading field; None and booleans are never accepted
+READING_FIELDS = {
+    'id': (str,),
+    'date': (str,),
+    'co2': (int,),
+    'temperature': (int, float),
+    'humidity': (int, float),
+}
+
+
+def init_db(db_path):
+    """Create the node_sensor_data table and switch the database to WAL mode."""
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS node_sensor_data (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            node_id TEXT NOT NULL,
+            reading_id TEXT NOT NULL,
+            date TEXT NOT NULL,
+            co2 INTEGER NOT NULL,
+            temperature REAL NOT NULL,
+            humidity REAL NOT NULL,
+            UNIQUE (node_id, reading_id)
+        );
+        ''')
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def decompress_body(body, max_size):
+    """
+    Decompress a gzip request body without expanding it past max_size bytes.
+
+    Args:
+        body (bytes): The gzip-compressed body.
+        max_size (int): The maximum decompressed size in bytes.
+
+    Returns:
+        bytes or None: The decompressed body, or None if it is larger than max_size.
+
+    Raises:
+        zlib.error: If the body is not valid gzip data.
+    """
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    data = decompressor.decompress(body, max_size + 1)
+    if len(data) > max_size:
+        return None
+    if not decompressor.eof:
+        raise zlib.error('truncated gzip body')
+    return data
+
+
+def is_valid_reading(reading):
+    """
+    Check that a reading has every field with an accepted, non-null type.
+
+    Args:
+        reading: One element of the posted readings list.
+
+    Returns:
+        bool: True if the reading can be stored, False otherwise.
+    """
+    if not isinstance(reading, dict):
+        return False
+    for field, types in READING_FIELDS.items():
+        value = reading.get(field)
+        if isinstance(value, bool) or not isinstance(value, types):
+            return False
+    return True
+
+
+def insert_readings(db_path, node_id, readings):
+    """
+    Bulk-insert a batch of readings from one node in a single transaction.
+
+    Readings already stored for the node are ignored, so replayed batches
+    do not create duplicates.
+
+    Args:
+        db_path (str): The file path to the collector SQLite database.
+        node_id (str): The identifier of the node that sent the batch.
+        readings (list[dict]): The readings to insert.
+
+    Returns:
+        int: The number of newly inserted readings.
+    """
+    rows = [
+        (node_id, r['id'], r['date'], r['co2'], r['temperature'], r['humidity'])
+        for r in readings
+    ]
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("PRAGMA synchronous=NORMAL")
+        before = conn.total_changes
+        with conn:
+            conn.executemany("""
+                INSERT OR IGNORE INTO node_sensor_data
+                    (node_id, reading_id, date, co2, temperature, humidity)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, rows)
+        return conn.total_changes - before
+    finally:
+        conn.close()
+
+
+@app.route('/ingest', methods=['POST'])
+def ingest():
+    """
+    Accept a batch of readings from a sensor node.
+
+    The body is a JSON object, optionally gzip-compressed, with a node_id
+    and a list of readings carrying id, date, co2, temperature and humidity.
+    """
+    body = request.get_data()
+    if request.headers.get('Content-Encoding') == 'gzip':
+        try:
+            body = decompress_body(body, MAX_DECOMPRESSED_SIZE)
+        except zlib.error:
+            return jsonify({'error': 'Invalid gzip body.'}), 400
+        if body is None:
+            return jsonify({'error': 'Decompressed body too large.'}), 413
+
+    try:
+        payload = json.loads(body)
+        node_id = str(payload['node_id'])
+        readings = payload['readings']
+        if not isinstance(readings, list) or not all(map(is_valid_reading, readings)):
+            raise ValueError('invalid reading')
+    except (ValueError, KeyError, TypeError):
+        return jsonify({'error': 'Invalid payload.'}), 400
+
+    try:
+        inserted = insert_readings(COLLECTOR_DB_PATH, node_id, readings)
+    except sqlite3.Error as e:
+        logger.error("Database error: %s", e)
+        return jsonify({'error': 'Database error.'}), 503
+
+    return jsonify({'received': len(readings), 'inserted': inserted}), 200
+
+
+init_db(COLLECTOR_DB_PATH)
+
+if __name__ == '__main__':
+    setup_logging()
+    app.run(host='0.0.0.0', port=5050, threaded=True)
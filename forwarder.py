@@ -0,0 +1,320 @@
+# pylint: disable=C0114
+
+import os
+import gzip
+import json
+import time
+import uuid
+import logging
+import threading
+import http.client
+import urllib.request
+import urllib.error
+
+logger = logging.getLogger('forwarder')
+
+# HTTP statuses meaning the payload itself is malformed, so resending it can never succeed
+REJECTED_STATUSES = (400, 422)
+
+
+class ReadingForwarder:  # pylint: disable=R0902,R0913
+    """
+    ReadingForwarder buffers sensor readings locally and sends them in
+    gzip-compressed JSON batches to a central collector over HTTP.
+
+    Sending happens on a background thread started with start(), so the
+    sensor loop never waits on the network. Readings that cannot be delivered
+    after the configured retries are appended to a spool file on disk and
+    replayed on the next flush. The spool is only rewritten after a successful
+    send, and holds at most max_spool_readings readings: when it grows past
+    that, the oldest readings are dropped until it is back to 90% of the limit.
+    Every reading carries a unique id, so the collector can drop duplicates
+    when a batch is replayed after a partially failed delivery.
+
+    Attributes:
+        collector_url (str): The URL of the collector ingest endpoint.
+        node_id (str): The identifier this node uses to tag its readings.
+        spool_path (str): The file path of the on-disk spool for undelivered readings.
+        batch_size (int): The number of buffered readings that triggers a flush.
+        flush_interval (float): The maximum number of seconds between flushes.
+        max_retries (int): The number of send attempts before spooling a batch.
+        backoff (float): The initial delay in seconds between send attempts, doubled each retry.
+        timeout (float): The HTTP request timeout in seconds.
+        max_spool_readings (int): The maximum number of readings kept in the spool.
+        buffer (list[dict]): Readings waiting to be sent.
+    """
+
+    MAX_REQUEST_READINGS = 1000
+
+    def __init__(self, collector_url, node_id, spool_path, *,
+                 batch_size=30, flush_interval=300, max_retries=3,
+                 backoff=0.5, timeout=5, max_spool_readings=50000):
+        self.collector_url = collector_url
+        self.node_id = node_id
+        self.spool_path = spool_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.max_spool_readings = max_spool_readings
+        self.buffer = []
+        self._spool_lines = self._count_spool_lines()
+        self._buffer_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start the background thread that flushes the buffer."""
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name='forwarder', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background thread after a final flush."""
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._wake.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        """Flush whenever a batch is full or the flush interval elapsed, until stopped."""
+        while not self._stopping.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            if not self._stopping.is_set():
+                self.flush()
+        self.flush()
+
+    def add(self, date, co2, temperature, humidity):
+        """
+        Buffer a reading and wake the background thread once the batch is full.
+
+        Args:
+            date (str): The reading timestamp in "%Y-%m-%d %H:%M:%S" format.
+            co2 (int): The CO2 concentration in ppm.
+            temperature (float): The temperature in °C.
+            humidity (float): The humidity percentage.
+        """
+        with self._buffer_lock:
+            self.buffer.append({
+                'id': uuid.uuid4().hex,
+                'date': date,
+                'co2': co2,
+                'temperature': temperature,
+                'humidity': humidity,
+            })
+            full = len(self.buffer) >= self.batch_size
+
+        if full:
+            self._wake.set()
+
+    def flush(self):
+        """
+        Send the spooled and buffered readings to the collector.
+
+        Buffered readings are appended to the spool first if it holds
+        readings, so the collector receives everything in order. If delivery
+        fails, every reading that was not delivered is kept in the spool.
+
+        Returns:
+            bool: True if all pending readings were delivered, False otherwise.
+        """
+        with self._flush_lock:
+            with self._buffer_lock:
+                batch, self.buffer = self.buffer, []
+
+            if self._spool_lines == 0:
+                if not batch or self._send(batch):
+                    return True
+                self._append_spool(batch)
+                return False
+
+            self._append_spool(batch)
+            return self._replay_spool()
+
+    def _send(self, readings):
+        """
+        POST a gzip-compressed batch to the collector, retrying with exponential backoff.
+
+        Args:
+            readings (list[dict]): The readings to send.
+
+        Returns:
+            bool: True if the collector accepted or rejected the batch as malformed,
+            False if it should be retried later.
+        """
+        body = gzip.compress(json.dumps({
+            'node_id': self.node_id,
+            'readings': readings,
+        }).encode('utf-8'))
+
+        delay = self.backoff
+        for attempt in range(1, self.max_retries + 1):
+            req = urllib.request.Request(
+                self.collector_url,
+                data=body,
+                headers={
+                    'Content-Type': 'application/json',
+                    'Content-Encoding': 'gzip',
+                },
+                method='POST',
+            )
+            try:
+                with urllib.request.urlopen(req, timeout=self.timeout) as response:
+                    if response.status == 200:
+                        return True
+            except urllib.error.HTTPError as e:
+                if e.code in REJECTED_STATUSES:
+                    # Resending a malformed batch can never succeed; drop it instead of spooling
+                    logger.error("Collector rejected batch: %s", e)
+                    return True
+                logger.warning(
+                    "Collector error (attempt %d/%d): %s", attempt, self.max_retries, e
+                )
+            except (urllib.error.URLError, http.client.HTTPException, OSError) as e:
+                logger.warning(
+                    "Collector error (attempt %d/%d): %s", attempt, self.max_retries, e
+                )
+
+            if attempt < self.max_retries:
+                time.sleep(delay)
+                delay *= 2
+
+        return False
+
+    def _replay_spool(self):
+        """
+        Send the spooled readings in chunks and remove the ones that were delivered.
+
+        Returns:
+            bool: True if the whole spool was delivered, False otherwise.
+        """
+        delivered = 0
+        complete = False
+        chunk, chunk_lines = [], 0
+        try:
+            with open(self.spool_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    chunk_lines += 1
+                    reading = self._parse_spool_line(line)
+                    if reading is not None:
+                        chunk.append(reading)
+                    if len(chunk) < self.MAX_REQUEST_READINGS:
+                        continue
+                    if not self._send(chunk):
+                        break
+                    delivered += chunk_lines
+                    chunk, chunk_lines = [], 0
+                else:
+                    complete = not chunk or self._send(chunk)
+        except OSError as e:
+            logger.error("Spool error: %s", e)
+            return False
+
+        if complete:
+            self._remove_spool()
+            return True
+        if delivered:
+            self._drop_spool_lines(delivered)
+        return False
+
+    def _parse_spool_line(self, line):
+        """
+        Parse one spool line.
+
+        Returns:
+            dict or None: The reading, or None if the line is empty, corrupt or not a reading.
+        """
+        line = line.strip()
+        if not line:
+            return None
+        try:
+            reading = json.loads(line)
+        except json.JSONDecodeError:
+            reading = None
+        if not isinstance(reading, dict):
+            # One bad reading would get its whole chunk rejected by the collector
+            logger.warning("Skipping corrupt spool line: %.80s", line)
+            return None
+        return reading
+
+    def _count_spool_lines(self):
+        """Count the lines in the spool file, or 0 if there is none."""
+        try:
+            with open(self.spool_path, 'rb') as f:
+                return sum(1 for _ in f)
+        except FileNotFoundError:
+            return 0
+        except OSError as e:
+            logger.error("Spool error: %s", e)
+            return 0
+
+    def _append_spool(self, readings):
+        """
+        Append readings to the spool file, one JSON object per line.
+
+        If the spool grows past max_spool_readings, the oldest readings are
+        dropped until it holds 90% of the limit.
+
+        Args:
+            readings (list[dict]): The readings to spool.
+        """
+        if not readings:
+            return
+
+        try:
+            with open(self.spool_path, 'a', encoding='utf-8') as f:
+                f.write(''.join(json.dumps(reading) + '\n' for reading in readings))
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            logger.error("Spool error, %d readings lost: %s", len(readings), e)
+            return
+        self._spool_lines += len(readings)
+
+        if self._spool_lines > self.max_spool_readings:
+            excess = self._spool_lines - self.max_spool_readings * 9 // 10
+            logger.warning("Spool full, dropping %d oldest readings", excess)
+            self._drop_spool_lines(excess)
+
+    def _drop_spool_lines(self, count):
+        """
+        Remove the first lines of the spool file.
+
+        The rest of the spool is copied to a temporary file and renamed into
+        place, so a power loss never leaves it half-written.
+
+        Args:
+            count (int): The number of lines to remove.
+        """
+        tmp_path = f"{self.spool_path}.tmp"
+        try:
+            kept = 0
+            with open(self.spool_path, 'r', encoding='utf-8') as src, \
+                    open(tmp_path, 'w', encoding='utf-8') as dst:
+                for index, line in enumerate(src):
+                    if index >= count:
+                        dst.write(line)
+                        kept += 1
+                dst.flush()
+                os.fsync(dst.fileno())
+            os.replace(tmp_path, self.spool_path)
+            self._spool_lines = kept
+        except OSError as e:
+            logger.error("Spool error: %s", e)
+
+    def _remove_spool(self):
+        """Delete the spool file once everything in it was delivered."""
+        try:
+            os.remove(self.spool_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error("Spool error: %s", e)
+            return
+        self._spool_lines = 0
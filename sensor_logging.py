@@ -0,0 +1,174 @@
+# pylint: disable=C0114
+
+import os
+import sys
+import time
+import queue
+import atexit
+import threading
+import logging
+import logging.handlers
+
+LOG_FORMAT = '%(levelname)s %(name)s: %(message)s'
+
+# Loggers on the per-frame ingest and polling paths whose repeated messages are rate limited
+RATE_LIMITED_LOGGERS = ('co2_sensor', 'forwarder', 'monitor')
+
+_listener = None  # pylint: disable=invalid-name
+
+
+class StructuredFormatter(logging.Formatter):
+    """
+    StructuredFormatter appends structured fields to the log line as key=value pairs.
+
+    Fields are passed with extra={'fields': {...}}. Float values are rounded
+    to two decimals to keep lines short.
+    """
+
+    def format(self, record):
+        line = super().format(record)
+        fields = getattr(record, 'fields', None)
+        if fields:
+            line += ' ' + ' '.join(
+                f"{key}={value:.2f}" if isinstance(value, float) else f"{key}={value}"
+                for key, value in fields.items()
+            )
+        return line
+
+
+class RateLimitFilter(logging.Filter):  # pylint: disable=too-few-public-methods
+    """
+    RateLimitFilter lets each message through at most once per interval.
+
+    Only records below WARNING from the given loggers are limited; warnings,
+    errors and every other logger always pass. Messages are keyed by logger
+    name, level and the unformatted message template, so lines that only
+    differ in their arguments share a limit. The next record that passes
+    carries the number of suppressed records in its 'suppressed' field,
+    which turns repeated per-frame messages into a periodic summary.
+
+    Attributes:
+        interval (float): The minimum number of seconds between records with the same key.
+        names (tuple[str]): The names of the loggers to rate limit.
+    """
+
+    def __init__(self, interval, names=RATE_LIMITED_LOGGERS):
+        super().__init__()
+        self.interval = interval
+        self.names = tuple(names)
+        self._last_emit = {}
+        self._suppressed = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING or record.name not in self.names:
+            return True
+
+        key = (record.name, record.levelno, record.msg)
+        now = time.monotonic()
+        with self._lock:
+            last = self._last_emit.get(key)
+            if last is not None and now - last < self.interval:
+                self._suppressed[key] = self._suppressed.get(key, 0) + 1
+                return False
+            self._last_emit[key] = now
+            suppressed = self._suppressed.pop(key, 0)
+
+        if suppressed:
+            record.fields = {**getattr(record, 'fields', {}), 'suppressed': suppressed}
+        return True
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """
+    DroppingQueueHandler hands records to a bounded queue without blocking.
+
+    When the queue is full the record is dropped and counted instead of
+    stalling the caller on a slow log sink. The next record that fits in the
+    queue carries the count in its 'dropped' field.
+
+    Attributes:
+        dropped (int): The number of records dropped since the last one was queued.
+    """
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record):
+        if self.dropped:
+            record.fields = {**getattr(record, 'fields', {}), 'dropped': self.dropped}
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            return
+        self.dropped = 0
+
+
+def setup_logging(level=None, rate_limit_interval=None, stream=None, queue_size=1000):
+    """
+    Configure the root logger with a non-blocking queue handler.
+
+    Records from RATE_LIMITED_LOGGERS below WARNING are rate limited, and
+    all records are queued in the calling thread, then formatted
+    and written to the stream by a background listener thread. Calling this
+    again replaces the previous configuration.
+
+    Args:
+        level (str or int or None): The log level, defaults to the LOG_LEVEL
+            environment variable or INFO.
+        rate_limit_interval (float or None): The minimum number of seconds between
+            repeats of the same ingest message, defaults to the LOG_RATE_LIMIT environment
+            variable or 60. Zero disables rate limiting.
+        stream (file or None): The stream to write to, defaults to sys.stderr.
+        queue_size (int): The maximum number of records waiting to be written.
+
+    Returns:
+        DroppingQueueHandler: The handler installed on the root logger.
+    """
+    global _listener  # pylint: disable=global-statement
+
+    if level is None:
+        level = os.getenv('LOG_LEVEL', 'INFO')
+    if rate_limit_interval is None:
+        rate_limit_interval = float(os.getenv('LOG_RATE_LIMIT', '60'))
+
+    if _listener is not None:
+        _listener.stop()
+
+    stream_handler = logging.StreamHandler(stream or sys.stderr)
+    stream_handler.setFormatter(StructuredFormatter(LOG_FORMAT))
+
+    queue_handler = DroppingQueueHandler(queue.Queue(queue_size))
+    if rate_limit_interval > 0:
+        queue_handler.addFilter(RateLimitFilter(rate_limit_interval))
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(queue_handler.queue, stream_handler)
+    _listener.start()
+    return queue_handler
+
+
+def shutdown_logging():
+    """Write out queued records, report any dropped ones and stop the listener thread."""
+    global _listener  # pylint: disable=global-statement
+
+    if _listener is not None:
+        for handler in logging.getLogger().handlers:
+            if isinstance(handler, DroppingQueueHandler) and handler.dropped:
+                handler.queue.put(logging.LogRecord(
+                    __name__, logging.WARNING, __file__, 0,
+                    "Log queue full, %d records dropped", (handler.dropped,), None
+                ))
+                handler.dropped = 0
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
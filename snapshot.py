@@ -0,0 +1,185 @@
+# pylint: disable=C0114
+
+import os
+import mmap
+import time
+import struct
+import threading
+
+DEFAULT_SNAPSHOT_PATH = '/dev/shm/co2_sensor_snapshot'
+
+# Sequence counter, Unix timestamp, CO2 (ppm), temperature (°C), humidity (%)
+SNAPSHOT_LAYOUT = struct.Struct('<Qdidd')
+SEQ_LAYOUT = struct.Struct('<Q')
+
+
+class SnapshotWriter:
+    """
+    SnapshotWriter publishes the latest sensor reading into a small fixed-layout,
+    memory-mapped file that other processes can read without touching the database.
+
+    Writes are guarded by a seqlock-style counter: it is odd while a write is in
+    progress and even once the reading is complete, so readers can detect and
+    retry a torn read.
+
+    Attributes:
+        path (str): The file path of the snapshot.
+        mm (mmap.mmap): The writable mapping of the snapshot file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            # Grow the file in place so readers that already mapped it stay valid
+            if os.fstat(fd).st_size < SNAPSHOT_LAYOUT.size:
+                os.ftruncate(fd, SNAPSHOT_LAYOUT.size)
+            self.mm = mmap.mmap(fd, SNAPSHOT_LAYOUT.size)
+        finally:
+            os.close(fd)
+
+    def publish(self, co2, temperature, humidity, timestamp=None):
+        """
+        Publish a reading to the snapshot.
+
+        Args:
+            co2 (int): The CO2 concentration in ppm.
+            temperature (float): The temperature in °C.
+            humidity (float): The humidity percentage.
+            timestamp (float or None): The Unix time of the reading, defaults to now.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+
+        seq = SEQ_LAYOUT.unpack_from(self.mm)[0]
+        if seq % 2:
+            # A previous writer died mid-write; step over its odd value
+            seq += 1
+        SEQ_LAYOUT.pack_into(self.mm, 0, seq + 1)
+        SNAPSHOT_LAYOUT.pack_into(self.mm, 0, seq + 1, timestamp, co2, temperature, humidity)
+        SEQ_LAYOUT.pack_into(self.mm, 0, seq + 2)
+
+    def close(self):
+        """Unmap the snapshot file."""
+        self.mm.close()
+
+
+class SnapshotReader:
+    """
+    SnapshotReader reads the latest sensor reading published by SnapshotWriter.
+
+    The file is mapped once and then read directly from memory. If the snapshot
+    is missing, never written, or older than max_age, read returns None so the
+    caller can fall back to the database. In that case the reader also checks
+    whether the file was deleted and recreated, and maps the new file if so.
+    A lock serialises reads and remaps, so one reader can be shared by the
+    threads of a web server.
+
+    Attributes:
+        path (str): The file path of the snapshot.
+        max_age (float): The age in seconds after which a snapshot is considered stale.
+        mm (mmap.mmap or None): The read-only mapping of the snapshot file.
+        inode (int or None): The inode of the mapped file.
+    """
+
+    MAX_ATTEMPTS = 10
+
+    def __init__(self, path, max_age=60):
+        self.path = path
+        self.max_age = max_age
+        self.mm = None
+        self.inode = None
+        self._lock = threading.Lock()
+
+    def _map(self):
+        """
+        Map the snapshot file if it is not mapped yet.
+
+        Returns:
+            bool: True if the snapshot is mapped, False if it does not exist yet.
+        """
+        if self.mm is not None:
+            return True
+
+        try:
+            fd = os.open(self.path, os.O_RDONLY)
+        except OSError:
+            return False
+        try:
+            self.mm = mmap.mmap(fd, SNAPSHOT_LAYOUT.size, access=mmap.ACCESS_READ)
+            self.inode = os.fstat(fd).st_ino
+        except (OSError, ValueError):
+            # The writer has not grown the file to its full size yet
+            return False
+        finally:
+            os.close(fd)
+        return True
+
+    def read(self):
+        """
+        Read the latest reading from the snapshot.
+
+        Returns:
+            dict or None: The reading with timestamp, co2, temperature and humidity,
+            or None if the snapshot is missing, stale or could not be read consistently.
+        """
+        with self._lock:
+            if not self._map():
+                return None
+
+            reading = self._read_mapped()
+            if reading is None and self._replaced():
+                self._unmap()
+                if self._map():
+                    reading = self._read_mapped()
+            return reading
+
+    def _replaced(self):
+        """
+        Check whether the snapshot file was deleted and recreated since it was mapped.
+
+        Returns:
+            bool: True if the path now points to a different file.
+        """
+        try:
+            return os.stat(self.path).st_ino != self.inode
+        except OSError:
+            return False
+
+    def _read_mapped(self):
+        """
+        Read the reading from the current mapping, retrying while a write is in progress.
+
+        Returns:
+            dict or None: The reading, or None if it is stale or could not be read consistently.
+        """
+        for _ in range(self.MAX_ATTEMPTS):
+            seq_before = SEQ_LAYOUT.unpack_from(self.mm)[0]
+            if seq_before % 2:
+                continue
+            _, timestamp, co2, temperature, humidity = SNAPSHOT_LAYOUT.unpack_from(self.mm)
+            if SEQ_LAYOUT.unpack_from(self.mm)[0] != seq_before:
+                continue
+
+            if seq_before == 0 or time.time() - timestamp > self.max_age:
+                return None
+            return {
+                'timestamp': timestamp,
+                'co2': co2,
+                'temperature': temperature,
+                'humidity': humidity,
+            }
+
+        return None
+
+    def close(self):
+        """Unmap the snapshot file."""
+        with self._lock:
+            self._unmap()
+
+    def _unmap(self):
+        """Unmap the snapshot file; the caller must hold the lock."""
+        if self.mm is not None:
+            self.mm.close()
+            self.mm = None
+            self.inode = None
@@ -62,6 +62,8 @@ class TestCO2Sensor(unittest.TestCase):
         self.assertIsNone(self.sensor.current_temperature)
         self.assertIsNone(self.sensor.current_humidity)
         self.assertIsNone(self.sensor.h)
+        self.assertIsNone(self.sensor.forwarder)
+        self.assertIsNone(self.sensor.snapshot)
 
     def test_parse_data_co2(self):
         """Test parsing CO2 data."""
@@ -163,6 +165,33 @@ class TestCO2Sensor(unittest.TestCase):
         mock_conn.commit.assert_called_once()
         mock_conn.close.assert_called_once()
 
+    def test_save_to_db_forwards_reading(self):
+        """Test that saved readings are handed to the forwarder."""
+        mock_forwarder = MagicMock()
+        self.sensor.forwarder = mock_forwarder
+
+        self.sensor.current_co2 = 800
+        self.sensor.current_temperature = 22.5
+        self.sensor.current_humidity = 45.0
+
+        self.sensor.save_to_db()
+
+        mock_forwarder.add.assert_called_once()
+        self.assertEqual(mock_forwarder.add.call_args.args[1:], (800, 22.5, 45.0))
+
+    def test_save_to_db_publishes_snapshot(self):
+        """Test that saved readings are published to the snapshot."""
+        mock_snapshot = MagicMock()
+        self.sensor.snapshot = mock_snapshot
+
+        self.sensor.current_co2 = 800
+        self.sensor.current_temperature = 22.5
+        self.sensor.current_humidity = 45.0
+
+        self.sensor.save_to_db()
+
+        mock_snapshot.publish.assert_called_once_with(800, 22.5, 45.0)
+
     @patch('sqlite3.connect')
     def test_save_to_db_error(self, mock_connect):
         """Test handling database errors."""
@@ -0,0 +1,170 @@
+"""
+Unit tests for the collector ingest endpoint.
+"""
+
+import os
+import sys
+import gzip
+import json
+import sqlite3
+import unittest
+from unittest.mock import patch
+
+TEST_DB_PATH = "test_collector_data.db"
+os.environ['COLLECTOR_DB_PATH'] = TEST_DB_PATH
+
+# Add collector directory to the path to import collector_server
+sys.path.append(os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'collector'
+))
+import collector_server  # pylint: disable=wrong-import-position
+
+
+def make_reading(reading_id, co2=600):
+    """Build a sample reading as sent by a node."""
+    return {
+        'id': reading_id,
+        'date': "2025-03-16 12:00:00",
+        'co2': co2,
+        'temperature': 22.5,
+        'humidity': 45.0,
+    }
+
+
+class TestCollectorServer(unittest.TestCase):
+    """Tests for the collector ingest endpoint."""
+
+    def setUp(self):
+        """Set up a fresh collector database and test client."""
+        collector_server.init_db(TEST_DB_PATH)
+        self.client = collector_server.app.test_client()
+
+    def tearDown(self):
+        """Clean up after tests."""
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(TEST_DB_PATH + suffix):
+                os.remove(TEST_DB_PATH + suffix)
+
+    def post_batch(self, node_id, readings):
+        """Post a gzip-compressed batch to the ingest endpoint."""
+        body = gzip.compress(json.dumps({'node_id': node_id, 'readings': readings}).encode())
+        return self.client.post(
+            '/ingest',
+            data=body,
+            headers={'Content-Type': 'application/json', 'Content-Encoding': 'gzip'},
+        )
+
+    def fetch_rows(self):
+        """Return the stored node_id, reading_id and co2 values."""
+        conn = sqlite3.connect(TEST_DB_PATH)
+        rows = conn.execute(
+            "SELECT node_id, reading_id, co2 FROM node_sensor_data ORDER BY id"
+        ).fetchall()
+        conn.close()
+        return rows
+
+    def test_ingest_stores_batch_tagged_by_node(self):
+        """Test that a batch is stored with the sending node id."""
+        response = self.post_batch('node-1', [make_reading('a', 600), make_reading('b', 700)])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), {'received': 2, 'inserted': 2})
+        self.assertEqual(self.fetch_rows(), [('node-1', 'a', 600), ('node-1', 'b', 700)])
+
+    def test_ingest_ignores_replayed_readings(self):
+        """Test that replaying a batch does not store duplicates."""
+        self.post_batch('node-1', [make_reading('a')])
+        response = self.post_batch('node-1', [make_reading('a'), make_reading('b')])
+
+        self.assertEqual(response.get_json(), {'received': 2, 'inserted': 1})
+        self.assertEqual(len(self.fetch_rows()), 2)
+
+    def test_ingest_same_reading_id_from_different_nodes(self):
+        """Test that reading ids are only deduplicated within one node."""
+        self.post_batch('node-1', [make_reading('a')])
+        self.post_batch('node-2', [make_reading('a')])
+
+        self.assertEqual(len(self.fetch_rows()), 2)
+
+    def test_ingest_invalid_payload(self):
+        """Test that malformed batches are rejected."""
+        response = self.post_batch('node-1', [{'id': 'a'}])
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.post('/ingest', data=b'not json')
+        self.assertEqual(response.status_code, 400)
+
+        self.assertEqual(self.fetch_rows(), [])
+
+    def test_ingest_wrong_field_types(self):
+        """Test that readings with wrong field types are rejected as malformed."""
+        for field, value in (('co2', [1]), ('id', {'x': 1}), ('date', 20250316),
+                             ('temperature', '22.5'), ('co2', True)):
+            reading = make_reading('a')
+            reading[field] = value
+            response = self.post_batch('node-1', [make_reading('b'), reading])
+            self.assertEqual(response.status_code, 400, (field, value))
+
+        response = self.post_batch('node-1', {'id': 'a'})
+        self.assertEqual(response.status_code, 400)
+
+        self.assertEqual(self.fetch_rows(), [])
+
+    def test_ingest_null_values(self):
+        """Test that readings with null values are rejected instead of silently ignored."""
+        for field in ('id', 'date', 'co2', 'temperature', 'humidity'):
+            reading = make_reading('a')
+            reading[field] = None
+            response = self.post_batch('node-1', [reading])
+            self.assertEqual(response.status_code, 400, field)
+
+        self.assertEqual(self.fetch_rows(), [])
+
+    def test_ingest_integer_temperature_and_humidity(self):
+        """Test that whole-number temperature and humidity values are accepted."""
+        reading = make_reading('a')
+        reading['temperature'] = 22
+        reading['humidity'] = 45
+
+        response = self.post_batch('node-1', [reading])
+
+        self.assertEqual(response.get_json(), {'received': 1, 'inserted': 1})
+
+    @patch('collector_server.insert_readings')
+    def test_ingest_database_error(self, mock_insert):
+        """Test that a database error is logged and answered with 503 so the node retries."""
+        mock_insert.side_effect = sqlite3.OperationalError("database is locked")
+
+        with self.assertLogs('collector', level='ERROR') as logs:
+            response = self.post_batch('node-1', [make_reading('a')])
+
+        self.assertEqual(response.status_code, 503)
+        self.assertIn("Database error: database is locked", logs.output[0])
+
+    def test_ingest_rejects_oversized_decompressed_body(self):
+        """Test that a small gzip body expanding past the limit is rejected."""
+        body = gzip.compress(b' ' * (collector_server.MAX_DECOMPRESSED_SIZE + 1))
+        response = self.client.post(
+            '/ingest', data=body, headers={'Content-Encoding': 'gzip'}
+        )
+
+        self.assertEqual(response.status_code, 413)
+
+    def test_ingest_rejects_truncated_gzip(self):
+        """Test that a truncated gzip body is rejected as invalid."""
+        body = gzip.compress(json.dumps({'node_id': 'node-1', 'readings': []}).encode())
+        response = self.client.post(
+            '/ingest', data=body[:-8], headers={'Content-Encoding': 'gzip'}
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_ingest_rejects_oversized_request(self):
+        """Test that a request body over MAX_CONTENT_LENGTH is rejected."""
+        body = b' ' * (collector_server.app.config['MAX_CONTENT_LENGTH'] + 1)
+        response = self.client.post('/ingest', data=body)
+
+        self.assertEqual(response.status_code, 413)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,241 @@
+"""
+Unit tests for the ReadingForwarder class.
+"""
+
+import os
+import sys
+import gzip
+import json
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import patch
+
+# Add parent directory to the path to import ReadingForwarder
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from forwarder import ReadingForwarder  # pylint: disable=wrong-import-position
+
+
+class FakeCollectorHandler(BaseHTTPRequestHandler):
+    """Records posted batches and answers with the queued or default status of the server."""
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Store the decoded batch and reply with the configured status."""
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        self.server.requests.append({
+            'encoding': self.headers.get('Content-Encoding'),
+            'payload': json.loads(gzip.decompress(body)),
+        })
+        statuses = self.server.statuses
+        self.send_response(statuses.pop(0) if statuses else self.server.status)
+        self.end_headers()
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Silence request logging."""
+
+
+class TestReadingForwarder(unittest.TestCase):
+    """Tests for the ReadingForwarder class."""
+
+    def setUp(self):
+        """Start a fake collector and create a forwarder pointing at it."""
+        self.server = HTTPServer(('127.0.0.1', 0), FakeCollectorHandler)
+        self.server.requests = []
+        self.server.status = 200
+        self.server.statuses = []
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.spool_path = os.path.join(self.tmp_dir.name, 'spool.jsonl')
+        self.forwarder = ReadingForwarder(
+            f"http://127.0.0.1:{self.server.server_port}/ingest",
+            'node-1',
+            self.spool_path,
+            batch_size=3,
+            backoff=0,
+        )
+
+    def tearDown(self):
+        """Stop the fake collector and remove the spool."""
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp_dir.cleanup()
+
+    def add_readings(self, count):
+        """Add a number of sample readings to the forwarder."""
+        for i in range(count):
+            self.forwarder.add(f"2025-03-16 12:00:0{i}", 600 + i, 22.5, 45.0)
+
+    def spooled_co2(self):
+        """Return the CO2 values stored in the spool, in order."""
+        with open(self.spool_path, encoding='utf-8') as f:
+            return [json.loads(line)['co2'] for line in f]
+
+    def test_add_buffers_until_batch_size(self):
+        """Test that readings are buffered and the sender is woken once the batch is full."""
+        self.add_readings(2)
+
+        self.assertEqual(len(self.forwarder.buffer), 2)
+        self.assertFalse(self.forwarder._wake.is_set())  # pylint: disable=protected-access
+
+        self.add_readings(1)
+        self.assertTrue(self.forwarder._wake.is_set())  # pylint: disable=protected-access
+        self.assertEqual(self.server.requests, [])
+
+    def test_flush_sends_compressed_batch(self):
+        """Test that a batch is sent gzip-compressed and tagged with the node id."""
+        self.add_readings(3)
+        self.assertTrue(self.forwarder.flush())
+
+        self.assertEqual(self.forwarder.buffer, [])
+        self.assertEqual(len(self.server.requests), 1)
+        request = self.server.requests[0]
+        self.assertEqual(request['encoding'], 'gzip')
+        self.assertEqual(request['payload']['node_id'], 'node-1')
+        self.assertEqual([r['co2'] for r in request['payload']['readings']], [600, 601, 602])
+        self.assertEqual(len({r['id'] for r in request['payload']['readings']}), 3)
+
+    def test_background_thread_sends_batch(self):
+        """Test that the background thread sends buffered readings and flushes on stop."""
+        self.forwarder.start()
+        self.add_readings(4)
+        self.forwarder.stop()
+
+        sent = [r['co2'] for req in self.server.requests for r in req['payload']['readings']]
+        self.assertEqual(sent, [600, 601, 602, 603])
+        self.assertEqual(self.forwarder.buffer, [])
+
+    def test_flush_failure_spools_and_replays(self):
+        """Test that undelivered readings are spooled and replayed in order with the same ids."""
+        self.server.status = 500
+        self.add_readings(3)
+        self.assertFalse(self.forwarder.flush())
+
+        self.assertEqual(len(self.server.requests), self.forwarder.max_retries)
+        self.assertEqual(self.spooled_co2(), [600, 601, 602])
+        spooled_ids = [r['id'] for r in self.server.requests[0]['payload']['readings']]
+
+        self.server.status = 200
+        self.server.requests.clear()
+        self.forwarder.add("2025-03-16 12:00:10", 700, 22.5, 45.0)
+        self.assertTrue(self.forwarder.flush())
+
+        readings = self.server.requests[0]['payload']['readings']
+        self.assertEqual([r['id'] for r in readings[:3]], spooled_ids)
+        self.assertEqual(readings[3]['co2'], 700)
+        self.assertFalse(os.path.exists(self.spool_path))
+
+    def test_flush_failure_appends_to_spool(self):
+        """Test that repeated failures append to the spool instead of rewriting it."""
+        self.server.status = 500
+        self.add_readings(2)
+        self.forwarder.flush()
+        inode = os.stat(self.spool_path).st_ino
+
+        self.add_readings(2)
+        self.forwarder.flush()
+
+        self.assertEqual(os.stat(self.spool_path).st_ino, inode)
+        self.assertEqual(self.spooled_co2(), [600, 601, 600, 601])
+
+    @patch.object(ReadingForwarder, 'MAX_REQUEST_READINGS', 2)
+    def test_flush_partial_replay_keeps_undelivered(self):
+        """Test that only the delivered part of the spool is removed after a partial replay."""
+        self.server.status = 500
+        self.add_readings(5)
+        self.forwarder.flush()
+
+        self.server.statuses = [200]
+        self.assertFalse(self.forwarder.flush())
+
+        self.assertEqual(self.spooled_co2(), [602, 603, 604])
+
+    def test_flush_rejected_batch_is_dropped(self):
+        """Test that a batch the collector rejects as malformed is not spooled."""
+        self.server.status = 400
+        self.add_readings(3)
+
+        self.assertTrue(self.forwarder.flush())
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertFalse(os.path.exists(self.spool_path))
+
+    def test_flush_not_found_is_spooled(self):
+        """Test that a 404 from a wrong collector path keeps the readings in the spool."""
+        self.server.status = 404
+        self.add_readings(3)
+
+        self.assertFalse(self.forwarder.flush())
+        self.assertEqual(len(self.server.requests), self.forwarder.max_retries)
+        self.assertEqual(self.spooled_co2(), [600, 601, 602])
+
+    def test_spool_drops_oldest_when_full(self):
+        """Test that a full spool drops its oldest readings down to 90% of the limit."""
+        self.forwarder.max_spool_readings = 10
+        self.forwarder.max_retries = 1
+        self.server.status = 500
+
+        self.add_readings(6)
+        self.forwarder.flush()
+        self.add_readings(6)
+        self.forwarder.flush()
+
+        self.assertEqual(self.spooled_co2(), [603, 604, 605, 600, 601, 602, 603, 604, 605])
+
+    def test_replay_skips_corrupt_spool_line(self):
+        """Test that a corrupt spool line is skipped and the readings after it are kept."""
+        with open(self.spool_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'id': 'a', 'co2': 600}) + '\n')
+            f.write('{"id": "b", "co2"\n')
+            f.write(json.dumps({'id': 'c', 'co2': 700}) + '\n')
+        forwarder = ReadingForwarder(self.forwarder.collector_url, 'node-1', self.spool_path)
+
+        self.assertTrue(forwarder.flush())
+        self.assertEqual(
+            [r['id'] for r in self.server.requests[0]['payload']['readings']], ['a', 'c']
+        )
+        self.assertFalse(os.path.exists(self.spool_path))
+
+    def test_replay_skips_non_reading_spool_lines(self):
+        """Test that valid JSON lines that are not readings are skipped."""
+        with open(self.spool_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'id': 'a', 'co2': 600}) + '\n')
+            f.write('null\n42\n[1, 2]\n"text"\n')
+            f.write(json.dumps({'id': 'c', 'co2': 700}) + '\n')
+        forwarder = ReadingForwarder(self.forwarder.collector_url, 'node-1', self.spool_path)
+
+        self.assertTrue(forwarder.flush())
+        self.assertEqual(
+            [r['id'] for r in self.server.requests[0]['payload']['readings']], ['a', 'c']
+        )
+        self.assertFalse(os.path.exists(self.spool_path))
+
+    @patch('os.remove')
+    def test_flush_spool_remove_error(self, mock_remove):
+        """Test that failing to remove a delivered spool does not raise."""
+        mock_remove.side_effect = OSError("Test remove error")
+        self.server.status = 500
+        self.add_readings(1)
+        self.forwarder.flush()
+
+        self.server.status = 200
+        self.assertTrue(self.forwarder.flush())
+        mock_remove.assert_called_once_with(self.spool_path)
+
+    @patch('time.sleep')
+    def test_flush_unreachable_collector_backs_off(self, mock_sleep):
+        """Test that retries against an unreachable collector back off exponentially."""
+        self.forwarder.collector_url = 'http://127.0.0.1:1/ingest'
+        self.forwarder.backoff = 0.5
+        self.forwarder.max_retries = 3
+
+        self.add_readings(1)
+
+        self.assertFalse(self.forwarder.flush())
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [0.5, 1.0])
+        self.assertTrue(os.path.exists(self.spool_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
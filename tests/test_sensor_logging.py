@@ -0,0 +1,139 @@
+"""
+Unit tests for the shared logging setup.
+"""
+
+import io
+import os
+import sys
+import queue
+import logging
+import unittest
+from unittest.mock import patch
+
+# Add parent directory to the path to import sensor_logging
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sensor_logging import (  # pylint: disable=wrong-import-position
+    StructuredFormatter, RateLimitFilter, DroppingQueueHandler,
+    setup_logging, shutdown_logging
+)
+
+
+def make_record(msg, *args, level=logging.INFO, fields=None, name='co2_sensor'):
+    """Build a log record as a logger would."""
+    record = logging.LogRecord(name, level, __file__, 1, msg, args, None)
+    if fields is not None:
+        record.fields = fields
+    return record
+
+
+class TestSensorLogging(unittest.TestCase):
+    """Tests for the shared logging setup."""
+
+    def tearDown(self):
+        """Restore the default root logger."""
+        shutdown_logging()
+        root = logging.getLogger()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+        root.setLevel(logging.WARNING)
+
+    def test_formatter_appends_fields(self):
+        """Test that structured fields are appended as key=value pairs."""
+        formatter = StructuredFormatter('%(levelname)s %(message)s')
+        record = make_record("Data saved", fields={'co2': 800, 'temperature': 22.456})
+
+        self.assertEqual(formatter.format(record), "INFO Data saved co2=800 temperature=22.46")
+
+    @patch('time.monotonic')
+    def test_rate_limit_suppresses_repeats(self, mock_monotonic):
+        """Test that repeats within the interval are dropped and counted on the next record."""
+        rate_limit = RateLimitFilter(60)
+
+        mock_monotonic.return_value = 0
+        self.assertTrue(rate_limit.filter(make_record("CO2: %d ppm", 600)))
+        mock_monotonic.return_value = 10
+        self.assertFalse(rate_limit.filter(make_record("CO2: %d ppm", 700)))
+        self.assertFalse(rate_limit.filter(make_record("CO2: %d ppm", 800)))
+
+        mock_monotonic.return_value = 61
+        record = make_record("CO2: %d ppm", 900, fields={'co2': 900})
+        self.assertTrue(rate_limit.filter(record))
+        self.assertEqual(record.fields, {'co2': 900, 'suppressed': 2})
+
+    @patch('time.monotonic')
+    def test_rate_limit_keys_by_message_and_level(self, mock_monotonic):
+        """Test that different messages and levels are limited separately."""
+        mock_monotonic.return_value = 0
+        rate_limit = RateLimitFilter(60)
+
+        self.assertTrue(rate_limit.filter(make_record("CO2: %d ppm", 600)))
+        self.assertTrue(rate_limit.filter(make_record("Humidity: %.2f%%", 45.0)))
+        self.assertTrue(rate_limit.filter(make_record("CO2: %d ppm", 600, level=logging.DEBUG)))
+
+    @patch('time.monotonic')
+    def test_rate_limit_skips_warnings_and_other_loggers(self, mock_monotonic):
+        """Test that warnings, errors and loggers off the ingest path are never limited."""
+        mock_monotonic.return_value = 0
+        rate_limit = RateLimitFilter(60)
+
+        for _ in range(3):
+            self.assertTrue(rate_limit.filter(make_record("Database error: %s", 'x',
+                                                          level=logging.ERROR)))
+            self.assertTrue(rate_limit.filter(make_record("Invalid data received.",
+                                                          level=logging.WARNING)))
+            self.assertTrue(rate_limit.filter(make_record("%s - - [%s] %s", 'a', 'b', 'c',
+                                                          name='werkzeug')))
+
+    def test_queue_handler_drops_when_full(self):
+        """Test that a full queue drops records instead of blocking."""
+        handler = DroppingQueueHandler(queue.Queue(1))
+
+        handler.handle(make_record("first"))
+        handler.handle(make_record("second"))
+
+        self.assertEqual(handler.queue.qsize(), 1)
+        self.assertEqual(handler.dropped, 1)
+
+    def test_queue_handler_reports_dropped_count(self):
+        """Test that the next queued record carries the number of dropped records."""
+        handler = DroppingQueueHandler(queue.Queue(1))
+        handler.handle(make_record("first"))
+        handler.handle(make_record("second"))
+        handler.handle(make_record("third"))
+        handler.queue.get_nowait()
+
+        handler.handle(make_record("fourth", fields={'co2': 800}))
+
+        self.assertEqual(handler.queue.get_nowait().fields, {'co2': 800, 'dropped': 2})
+        self.assertEqual(handler.dropped, 0)
+
+    def test_shutdown_reports_dropped_count(self):
+        """Test that records still counted as dropped are reported when logging stops."""
+        stream = io.StringIO()
+        handler = setup_logging(level='INFO', stream=stream)
+        handler.dropped = 5
+
+        shutdown_logging()
+
+        self.assertIn(
+            "WARNING sensor_logging: Log queue full, 5 records dropped", stream.getvalue()
+        )
+
+    def test_setup_logging_writes_through_listener(self):
+        """Test that records reach the stream after the listener is stopped."""
+        stream = io.StringIO()
+        setup_logging(level='INFO', rate_limit_interval=60, stream=stream)
+        logger = logging.getLogger('co2_sensor')
+
+        logger.debug("Data read: %s", [0x50])
+        for co2 in (600, 700, 800):
+            logger.info("Data saved to database", extra={'fields': {'co2': co2}})
+        shutdown_logging()
+
+        self.assertEqual(
+            stream.getvalue(), "INFO co2_sensor: Data saved to database co2=600\n"
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
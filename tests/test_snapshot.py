@@ -0,0 +1,137 @@
+"""
+Unit tests for the SnapshotWriter and SnapshotReader classes.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+# Add parent directory to the path to import the snapshot classes
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from snapshot import (  # pylint: disable=wrong-import-position
+    SnapshotWriter, SnapshotReader, SEQ_LAYOUT
+)
+
+
+class TestSnapshot(unittest.TestCase):
+    """Tests for the memory-mapped latest-reading snapshot."""
+
+    def setUp(self):
+        """Set up a snapshot path in a temporary directory."""
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = os.path.join(self.tmp_dir.name, 'snapshot')
+        self.reader = SnapshotReader(self.path)
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.reader.close()
+        self.tmp_dir.cleanup()
+
+    def test_read_missing_snapshot(self):
+        """Test that a missing snapshot reads as None."""
+        self.assertIsNone(self.reader.read())
+
+    def test_read_never_written_snapshot(self):
+        """Test that a snapshot created but never written reads as None."""
+        writer = SnapshotWriter(self.path)
+
+        self.assertIsNone(self.reader.read())
+        writer.close()
+
+    def test_publish_and_read(self):
+        """Test that a published reading is read back."""
+        writer = SnapshotWriter(self.path)
+        writer.publish(800, 22.5, 45.0, timestamp=1000.0)
+        self.reader.max_age = float('inf')
+
+        self.assertEqual(self.reader.read(), {
+            'timestamp': 1000.0,
+            'co2': 800,
+            'temperature': 22.5,
+            'humidity': 45.0,
+        })
+
+        writer.publish(900, 23.0, 40.0)
+        self.assertEqual(self.reader.read()['co2'], 900)
+        writer.close()
+
+    def test_read_stale_snapshot(self):
+        """Test that a snapshot older than max_age reads as None."""
+        writer = SnapshotWriter(self.path)
+        writer.publish(800, 22.5, 45.0, timestamp=time.time() - 120)
+
+        self.assertIsNone(self.reader.read())
+        writer.close()
+
+    def test_read_during_write(self):
+        """Test that a snapshot with a write in progress is not returned."""
+        writer = SnapshotWriter(self.path)
+        writer.publish(800, 22.5, 45.0)
+        SEQ_LAYOUT.pack_into(writer.mm, 0, 3)
+
+        self.assertIsNone(self.reader.read())
+        writer.close()
+
+    def test_writer_restart_keeps_reader_mapping(self):
+        """Test that a restarted writer publishes to readers that mapped the old writer's file."""
+        writer = SnapshotWriter(self.path)
+        writer.publish(800, 22.5, 45.0)
+        self.assertEqual(self.reader.read()['co2'], 800)
+        writer.close()
+
+        writer = SnapshotWriter(self.path)
+        writer.publish(900, 22.5, 45.0)
+        self.assertEqual(self.reader.read()['co2'], 900)
+        writer.close()
+
+    def test_reader_remaps_recreated_file(self):
+        """Test that the reader maps the new file after the snapshot is deleted and recreated."""
+        writer = SnapshotWriter(self.path)
+        writer.publish(800, 22.5, 45.0, timestamp=time.time() - 120)
+        self.assertIsNone(self.reader.read())
+        writer.close()
+        os.remove(self.path)
+
+        writer = SnapshotWriter(self.path)
+        writer.publish(900, 22.5, 45.0)
+        self.assertEqual(self.reader.read()['co2'], 900)
+        writer.close()
+
+    def test_close_waits_for_read_in_progress(self):
+        """Test that another thread cannot unmap the file while a read is using it."""
+        writer = SnapshotWriter(self.path)
+        writer.publish(800, 22.5, 45.0)
+        inside_read = threading.Event()
+        finish_read = threading.Event()
+        read_mapped = self.reader._read_mapped  # pylint: disable=protected-access
+
+        def slow_read_mapped():
+            inside_read.set()
+            finish_read.wait(5)
+            return read_mapped()
+
+        results = []
+        with patch.object(self.reader, '_read_mapped', slow_read_mapped):
+            reader_thread = threading.Thread(target=lambda: results.append(self.reader.read()))
+            reader_thread.start()
+            inside_read.wait(5)
+
+            closer_thread = threading.Thread(target=self.reader.close)
+            closer_thread.start()
+            closer_thread.join(0.2)
+            self.assertTrue(closer_thread.is_alive())
+
+            finish_read.set()
+            reader_thread.join()
+            closer_thread.join()
+
+        self.assertEqual(results[0]['co2'], 800)
+        self.assertIsNone(self.reader.mm)
+        writer.close()
+
+if __name__ == '__main__':
+    unittest.main()
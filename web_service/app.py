@@ -2,7 +2,10 @@
 # pylint: disable=import-error
 
 import os
+import sys
+import logging
 import sqlite3
+from datetime import datetime
 import pandas as pd
 from flask import Flask, render_template
 import plotly.graph_objs as go
@@ -10,17 +13,38 @@ from plotly.subplots import make_subplots
 from werkzeug.middleware.profiler import ProfilerMiddleware
 from dotenv import load_dotenv
 
+# Add parent directory to the path to import the snapshot reader
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from snapshot import SnapshotReader, DEFAULT_SNAPSHOT_PATH  # pylint: disable=wrong-import-position
+from sensor_logging import setup_logging  # pylint: disable=wrong-import-position
+
 load_dotenv()
 
 app = Flask(__name__)
+logger = logging.getLogger('web_service')
 
 # Determine the absolute path to the database file
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DB_NAME = os.path.join(BASE_DIR, 'sensor_data.db')
 DB_PATH = os.getenv('DB_PATH')
+SNAPSHOT_PATH = os.getenv('SNAPSHOT_PATH', DEFAULT_SNAPSHOT_PATH)
+
+snapshot_reader = SnapshotReader(SNAPSHOT_PATH)
 
 def get_latest_data():
-    """Fetches the latest sensor data from the database."""
+    """
+    Fetches the latest sensor data from the shared snapshot,
+    falling back to the database if the snapshot is missing or stale.
+    """
+    reading = snapshot_reader.read()
+    if reading:
+        return {
+            'date': datetime.fromtimestamp(reading['timestamp']).strftime("%Y-%m-%d %H:%M:%S"),
+            'co2': int(reading['co2']),
+            'temperature': round(reading['temperature'], 2),
+            'humidity': float(reading['humidity'])
+        }
+
     try:
         conn = sqlite3.connect(DB_PATH)
         cursor = conn.cursor()
@@ -41,7 +65,7 @@ def get_latest_data():
             }
         return {'date': 'N/A', 'co2': 'N/A', 'temperature': 'N/A', 'humidity': 'N/A'}
     except sqlite3.Error as e:
-        print(f"Database error: {e}")
+        logger.error("Database error: %s", e)
         return {'date': 'Error', 'co2': 'Error', 'temperature': 'Error', 'humidity': 'Error'}
     finally:
         conn.close()
@@ -55,7 +79,7 @@ def fetch_last_day():
         df['date'] = pd.to_datetime(df['date'])
         return df
     except sqlite3.Error as e:
-        print(f"Database error: {e}")
+        logger.error("Database error: %s", e)
         return pd.DataFrame()
     finally:
         conn.close()
@@ -118,6 +142,7 @@ def current():
     return render_template('current.html', current_data=current_data)
 
 if __name__ == '__main__':
+    setup_logging()
     app.debug = True
     app.wsgi_app = ProfilerMiddleware(app.wsgi_app, restrictions=[30])
     app.run(host='0.0.0.0', port=5000)